@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 
-from packaging import version
+from awesomeversion import AwesomeVersion
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import (
@@ -22,11 +21,9 @@ from homeassistant.exceptions import (
     HomeAssistantError,
     IntegrationError,
 )
-from homeassistant.util import dt as dt_util
 
 from .const import BLE_CALLBACK, CONF_MAC, DOMAIN, MIN_HA_VERSION
 from .coordinator import VogelsMotionMountBleCoordinator
-from .data import VogelsMotionMountAuthenticationType
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,12 +41,15 @@ PLATFORMS: list[Platform] = [
 type VogelsMotionMountBleConfigEntry = ConfigEntry[VogelsMotionMountBleCoordinator]
 
 
+_MIN_HA_VERSION = AwesomeVersion(MIN_HA_VERSION)
+
+
 async def async_setup(
     hass: HomeAssistant, entry: VogelsMotionMountBleConfigEntry
 ) -> bool:
     """Set up Vogels Motion Mount integration services."""
     _LOGGER.debug("async_setup called with config_entry: %s", entry)
-    if version.parse(ha_version) < version.parse(MIN_HA_VERSION):
+    if AwesomeVersion(ha_version) < _MIN_HA_VERSION:
         raise IntegrationError(
             translation_key="invalid_ha_version",
             translation_placeholders={"version": MIN_HA_VERSION},
@@ -64,9 +64,6 @@ async def async_setup_entry(
     """Set up Vogels Motion Mount Integration from a config entry."""
     _LOGGER.debug("async_setup_entry called with config_entry: %s", config_entry)
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
-
     # Initialise the coordinator that manages data updates from your api.
     device = bluetooth.async_ble_device_from_address(
         hass=hass,
@@ -77,7 +74,11 @@ async def async_setup_entry(
     if device is None:
         _LOGGER.debug("async_setup_entry device not found")
 
-        if hass.data[DOMAIN][config_entry.entry_id].get(BLE_CALLBACK) is None:
+        # only kept in hass.data as it has to outlive the failed setup attempts
+        entry_data = hass.data.setdefault(DOMAIN, {}).setdefault(
+            config_entry.entry_id, {}
+        )
+        if entry_data.get(BLE_CALLBACK) is None:
             # Register a callback to retry setup when the device appears
             def _available_callback(
                 info: BluetoothServiceInfoBleak, change: BluetoothChange
@@ -96,13 +97,14 @@ async def async_setup_entry(
                 {"address": config_entry.data[CONF_MAC], "connectable": True},
                 BluetoothScanningMode.ACTIVE,
             )
-            hass.data[DOMAIN][config_entry.entry_id][BLE_CALLBACK] = (
-                unregister_ble_callback
-            )
+            entry_data[BLE_CALLBACK] = unregister_ble_callback
         raise ConfigEntryNotReady(
             translation_key="error_device_not_found",
         )
 
+    # device is available, the coordinator tracks it from now on
+    _async_unregister_ble_callback(hass, config_entry)
+
     # Registers update listener to update config entry when options are updated.
     unsub_update_listener = config_entry.add_update_listener(async_reload_entry)
 
@@ -118,11 +120,11 @@ async def async_setup_entry(
         await coordinator.async_config_entry_first_refresh()
     except ConfigEntryAuthFailed as err:
         # do not reload if setup failed
-        _LOGGER.debug("async_setup_entry ConfigEntryAuthFailed %s", str(err))
+        _LOGGER.debug("async_setup_entry ConfigEntryAuthFailed %s", err)
         unsub_update_listener()
         raise err from err
     except HomeAssistantError as err:
-        _LOGGER.debug("async_setup_entry HomeAssistantError %s", str(err))
+        _LOGGER.debug("async_setup_entry HomeAssistantError %s", err)
         # do not reload if setup failed
         unsub_update_listener()
         raise ConfigEntryNotReady(
@@ -130,7 +132,7 @@ async def async_setup_entry(
             translation_placeholders=err.translation_placeholders,
         ) from err
     except Exception as err:
-        _LOGGER.debug("async_setup_entry Exception %s", str(err))
+        _LOGGER.debug("async_setup_entry Exception %s", err)
         # do not reload if setup failed
         unsub_update_listener()
         raise ConfigEntryNotReady(
@@ -138,22 +140,8 @@ async def async_setup_entry(
             translation_placeholders={"error": repr(err)},
         ) from err
 
-    permissions = coordinator.data.permissions
-    if permissions.auth_status.auth_type == VogelsMotionMountAuthenticationType.Wrong:
-        if permissions.auth_status.cooldown and permissions.auth_status.cooldown > 0:
-            retry_time = dt_util.now() + timedelta(
-                seconds=permissions.auth_status.cooldown
-            )
-            raise ConfigEntryAuthFailed(
-                translation_key="error_invalid_authentication_cooldown",
-                translation_placeholders={
-                    "retry_at": retry_time.strftime("%Y-%m-%d %H:%M:%S")
-                },
-            )
-        raise ConfigEntryAuthFailed(
-            translation_key="error_invalid_authentication",
-        )
-
+    # Entities read coordinator.data while being created (e.g. preset options),
+    # so platforms are only forwarded once the first refresh provided data.
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     return True
@@ -176,12 +164,7 @@ async def async_unload_entry(
     """Unload a config entry."""
     _LOGGER.debug("async_unload_entry")
 
-    entry_data = hass.data[DOMAIN].get(config_entry.entry_id)
-    if entry_data:
-        unregister_ble_callback = entry_data.get(BLE_CALLBACK)
-        if unregister_ble_callback:
-            _LOGGER.debug("unregister_ble_callback")
-            unregister_ble_callback()
+    _async_unregister_ble_callback(hass, config_entry)
 
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
@@ -191,3 +174,13 @@ async def async_unload_entry(
         bluetooth.async_rediscover_address(hass, config_entry.data[CONF_MAC])
 
     return unload_ok
+
+
+def _async_unregister_ble_callback(
+    hass: HomeAssistant, config_entry: VogelsMotionMountBleConfigEntry
+) -> None:
+    """Unregister and drop the callback waiting for the device to appear."""
+    entry_data = hass.data.get(DOMAIN, {}).pop(config_entry.entry_id, None)
+    if entry_data and (unregister_ble_callback := entry_data.get(BLE_CALLBACK)):
+        _LOGGER.debug("unregister_ble_callback")
+        unregister_ble_callback()
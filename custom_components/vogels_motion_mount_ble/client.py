@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 import logging
 import struct
 
@@ -32,6 +33,7 @@ from .const import (
     CHAR_VERSIONS_CEB_UUID,
     CHAR_VERSIONS_MCP_UUID,
     CHAR_WIDTH_UUID,
+    PRESET_NAME_MAX_BYTES,
 )
 from .data import (
     VogelsMotionMountAuthenticationStatus,
@@ -47,6 +49,28 @@ from .data import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# precompiled formats of the big endian values used by the characteristics
+_AUTOMOVE = struct.Struct(">H")
+_DISTANCE = struct.Struct(">H")
+_ROTATION = struct.Struct(">h")
+# exists flag, distance and rotation in front of the preset name
+_PRESET_HEADER = struct.Struct(">BHh")
+# full preset layout split over the preset (20 bytes) and name (17 bytes) characteristic
+_PRESET = struct.Struct(f">BHh{PRESET_NAME_MAX_BYTES}s")
+_PRESET_SPLIT = 20
+_DELETED_PRESET = bytes(_PRESET.size)
+# single byte payloads, indexed by their value
+_BYTES = tuple(bytes((value,)) for value in range(256))
+# name truncated or padded with zeros to the 20 bytes of the characteristic
+_NAME = struct.Struct("20s")
+# pins and the wrong pin cooldown are little endian
+_PIN = struct.Struct("<H")
+_COOLDOWN = struct.Struct("<I")
+# supervisior pins are sent with the high byte offset by 64
+_SUPERVISIOR_PIN_OFFSET = 0x4000
+# movement requests are confirmed by notifications, no need to wait for a write response
+_MOVEMENT_UUIDS = (CHAR_DISTANCE_UUID, CHAR_ROTATION_UUID, CHAR_PRESET_UUID)
+
 # -------------------------------
 # region Exceptions
 # -------------------------------
@@ -95,10 +119,21 @@ class VogelsMotionMountBluetoothClient:
         self._device = device
         self._connection_callback = connection_callback
         self._permission_callback = permission_callback
-        self._distance_callback = distance_callback
-        self._rotation_callback = rotation_callback
         self._session_data: _VogelsMotionMountSessionData | None = None
         self._connect_lock = asyncio.Lock()
+        # bound once, reused for the subscriptions of every connection
+        self._notification_handlers = {
+            CHAR_DISTANCE_UUID: partial(
+                self._handle_notification, _DISTANCE, distance_callback
+            ),
+            CHAR_ROTATION_UUID: partial(
+                self._handle_notification, _ROTATION, rotation_callback
+            ),
+        }
+
+    def update_device(self, device: BLEDevice):
+        """Update the BLEDevice used for (re)connecting with the latest one seen by Home Assistant."""
+        self._device = device
 
     # -------------------------------
     # region Read
@@ -116,7 +151,7 @@ class VogelsMotionMountBluetoothClient:
     async def read_distance(self) -> int:
         """Read and return the current distance value from the Vogels Motion Mount."""
         data = await self._read(CHAR_DISTANCE_UUID)
-        return int.from_bytes(data, "big")
+        return _DISTANCE.unpack_from(data)[0]
 
     async def read_freeze_preset_index(self) -> int:
         """Read and return the index of the current freeze preset from the Vogels Motion Mount."""
@@ -124,20 +159,13 @@ class VogelsMotionMountBluetoothClient:
 
     async def read_multi_pin_features(self) -> VogelsMotionMountMultiPinFeatures:
         """Read and return the current multi-pin feature flags from the Vogels Motion Mount."""
-        data = (await self._read(CHAR_MULTI_PIN_FEATURES_UUID))[0]
-        return VogelsMotionMountMultiPinFeatures(
-            change_presets=bool(data & (1 << 0)),
-            change_name=bool(data & (1 << 1)),
-            disable_channel=bool(data & (1 << 2)),
-            change_tv_on_off_detection=bool(data & (1 << 3)),
-            change_default_position=bool(data & (1 << 4)),
-            start_calibration=bool(data & (1 << 7)),
-        )
+        data = await self._read(CHAR_MULTI_PIN_FEATURES_UUID)
+        return _decode_multi_pin_features(data[0])
 
     async def read_name(self) -> str:
         """Read and return the current name of the Vogels Motion Mount."""
         data = await self._read(CHAR_NAME_UUID)
-        return data.decode("utf-8").rstrip("\x00")
+        return data.rstrip(b"\x00").decode("utf-8")
 
     async def read_pin_settings(self) -> VogelsMotionMountPinSettings:
         """Read and return the current pin settings of the Vogels Motion Mount."""
@@ -146,35 +174,38 @@ class VogelsMotionMountBluetoothClient:
 
     async def read_presets(self) -> list[VogelsMotionMountPreset]:
         """Read and return a list of all preset configurations from the Vogels Motion Mount."""
-        return [
-            await self.read_preset(index) for index in range(len(CHAR_PRESET_UUIDS))
-        ]
+        return list(
+            await asyncio.gather(
+                *(self.read_preset(index) for index in range(len(CHAR_PRESET_UUIDS)))
+            )
+        )
 
     async def read_preset(self, index: int) -> VogelsMotionMountPreset:
         """Read and return the preset configuration at the specified index."""
-        data = await self._read(CHAR_PRESET_UUIDS[index]) + await self._read(
-            CHAR_PRESET_NAMES_UUIDS[index]
+        data_preset, data_name = await asyncio.gather(
+            self._read(CHAR_PRESET_UUIDS[index]),
+            self._read(CHAR_PRESET_NAMES_UUIDS[index]),
         )
+        data = data_preset + data_name
         if data[0] != 0:
-            data = VogelsMotionMountPresetData(
-                distance=max(0, min(int.from_bytes(data[1:3], "big"), 100)),
-                name=data[5:].decode("utf-8").rstrip("\x00"),
-                rotation=max(
-                    -100, min(int.from_bytes(data[3:5], "big", signed=True), 100)
-                ),
+            _, distance, rotation = _PRESET_HEADER.unpack_from(data)
+            preset_data = VogelsMotionMountPresetData(
+                distance=max(0, min(distance, 100)),
+                name=data[_PRESET_HEADER.size :].rstrip(b"\x00").decode("utf-8"),
+                rotation=max(-100, min(rotation, 100)),
             )
         else:
-            data = None
+            preset_data = None
 
         return VogelsMotionMountPreset(
             index=index,
-            data=data,
+            data=preset_data,
         )
 
     async def read_rotation(self) -> int:
         """Read and return the current rotation value from the Vogels Motion Mount."""
         data = await self._read(CHAR_ROTATION_UUID)
-        return int.from_bytes(data, "big")
+        return _ROTATION.unpack_from(data)[0]
 
     async def read_tv_width(self) -> int:
         """Read and return the width of the TV from the Vogels Motion Mount."""
@@ -182,32 +213,42 @@ class VogelsMotionMountBluetoothClient:
 
     async def read_versions(self) -> VogelsMotionMountVersions:
         """Read and return the firmware and hardware version information from the Vogels Motion Mount."""
-        data_ceb = await self._read(CHAR_VERSIONS_CEB_UUID)
-        data_mcp = await self._read(CHAR_VERSIONS_MCP_UUID)
+        data_ceb, data_mcp = await asyncio.gather(
+            self._read(CHAR_VERSIONS_CEB_UUID),
+            self._read(CHAR_VERSIONS_MCP_UUID),
+        )
         return VogelsMotionMountVersions(
-            ceb_bl_version=".".join(str(b) for b in data_ceb),
-            mcp_hw_version=".".join(str(b) for b in data_mcp[:3]),
-            mcp_bl_version=".".join(str(b) for b in data_mcp[3:5]),
-            mcp_fw_version=".".join(str(b) for b in data_mcp[5:7]),
+            # the length of the ceb version is not documented, keep all of its bytes
+            ceb_bl_version=".".join(map(str, data_ceb)),
+            mcp_hw_version=f"{data_mcp[0]}.{data_mcp[1]}.{data_mcp[2]}",
+            mcp_bl_version=f"{data_mcp[3]}.{data_mcp[4]}",
+            mcp_fw_version=f"{data_mcp[5]}.{data_mcp[6]}",
         )
 
     # -------------------------------
     # region Control
     # -------------------------------
 
+    @property
+    def is_connected(self) -> bool:
+        """Return if a session with the device is currently established."""
+        return self._session_data is not None
+
     async def disconnect(self):
         """Disconnect from the Vogels Motion Mount BLE device if connected."""
-        if self._session_data:
-            await self._session_data.client.disconnect()
+        # wait for a pending connect, otherwise its session would outlive the disconnect
+        async with self._connect_lock:
+            if self._session_data:
+                await self._session_data.client.disconnect()
 
     async def select_preset(self, preset_index: int):
         """Select the preset at the given index on the Vogels Motion Mount."""
         assert preset_index in range(8)
-        await self._write(CHAR_PRESET_UUID, bytes([preset_index]))
+        await self._write(CHAR_PRESET_UUID, _BYTES[preset_index])
 
     async def start_calibration(self):
         """Start the calibration process on the Vogels Motion Mount."""
-        await self._write(CHAR_CALIBRATE_UUID, bytes([1]))
+        await self._write(CHAR_CALIBRATE_UUID, _BYTES[1])
 
     # -------------------------------
     # region Write
@@ -218,7 +259,7 @@ class VogelsMotionMountBluetoothClient:
         assert distance in range(101)
         await self._write(
             char_uuid=CHAR_DISTANCE_UUID,
-            data=int(distance).to_bytes(2, byteorder="big"),
+            data=_DISTANCE.pack(distance),
         )
 
     async def request_rotation(self, rotation: int):
@@ -226,7 +267,7 @@ class VogelsMotionMountBluetoothClient:
         assert rotation in range(-100, 101)
         await self._write(
             char_uuid=CHAR_ROTATION_UUID,
-            data=int(rotation).to_bytes(2, byteorder="big", signed=True),
+            data=_ROTATION.pack(rotation),
         )
 
     async def set_authorised_user_pin(self, pin: str):
@@ -235,14 +276,14 @@ class VogelsMotionMountBluetoothClient:
         assert len(pin) == 4
         await self._write(
             char_uuid=CHAR_CHANGE_PIN_UUID,
-            data=int(pin).to_bytes(2, byteorder="little"),
+            data=_PIN.pack(int(pin)),
         )
 
     async def set_automove(self, automove: VogelsMotionMountAutoMoveType):
         """Set the automove type on the Vogels Motion Mount."""
         await self._write(
             char_uuid=CHAR_AUTOMOVE_UUID,
-            data=int(automove.value).to_bytes(2, byteorder="big"),
+            data=_AUTOMOVE.pack(automove.value),
         )
 
     async def set_freeze_preset(self, preset_index: int):
@@ -250,7 +291,7 @@ class VogelsMotionMountBluetoothClient:
         assert preset_index in range(8)
         await self._write(
             char_uuid=CHAR_FREEZE_UUID,
-            data=bytes([preset_index]),
+            data=_BYTES[preset_index],
         )
 
     async def set_multi_pin_features(self, features: VogelsMotionMountMultiPinFeatures):
@@ -264,7 +305,7 @@ class VogelsMotionMountBluetoothClient:
         value |= int(features.start_calibration) << 7
         await self._write(
             char_uuid=CHAR_MULTI_PIN_FEATURES_UUID,
-            data=bytes([value]),
+            data=_BYTES[value],
         )
 
     async def set_name(self, name: str):
@@ -272,7 +313,7 @@ class VogelsMotionMountBluetoothClient:
         assert len(name) in range(1, 21)
         await self._write(
             char_uuid=CHAR_NAME_UUID,
-            data=bytearray(name.encode("utf-8"))[:20].ljust(20, b"\x00"),
+            data=_NAME.pack(name.encode("utf-8")),
         )
 
     async def set_preset(self, preset: VogelsMotionMountPreset):
@@ -281,23 +322,27 @@ class VogelsMotionMountBluetoothClient:
         if preset.data:
             assert preset.data.distance in range(101)
             assert preset.data.rotation in range(-100, 101)
-            assert len(preset.data.name) in range(1, 33)
-            data = (
-                b"\x01"
-                + int(preset.data.distance).to_bytes(2, byteorder="big")
-                + int(preset.data.rotation).to_bytes(2, byteorder="big", signed=True)
-                + preset.data.name.encode("utf-8")
+            assert len(preset.data.name.encode("utf-8")) in range(
+                1, PRESET_NAME_MAX_BYTES + 1
+            )
+            # the name is padded with zeros to the end of the name characteristic
+            data = _PRESET.pack(
+                1,
+                preset.data.distance,
+                preset.data.rotation,
+                preset.data.name.encode("utf-8"),
             )
         else:
-            data = b"\x00"
+            data = _DELETED_PRESET
 
+        # the device expects the preset before its name, write them one after another
         await self._write(
             char_uuid=CHAR_PRESET_UUIDS[preset.index],
-            data=data[:20].ljust(20, b"\x00"),
+            data=data[:_PRESET_SPLIT],
         )
         await self._write(
             char_uuid=CHAR_PRESET_NAMES_UUIDS[preset.index],
-            data=data[20:].ljust(17, b"\x00"),
+            data=data[_PRESET_SPLIT:],
         )
 
     async def set_supervisior_pin(self, pin: str):
@@ -313,7 +358,7 @@ class VogelsMotionMountBluetoothClient:
         assert width in range(1, 244)
         await self._write(
             char_uuid=CHAR_WIDTH_UUID,
-            data=bytes([width]),
+            data=_BYTES[width],
         )
 
     # -------------------------------
@@ -333,17 +378,24 @@ class VogelsMotionMountBluetoothClient:
                 device=self._device,
                 name=self._device.name or "Unknown Device",
                 disconnected_callback=self._handle_disconnect,
+                ble_device_callback=lambda: self._device,
             )
 
-            pers = await get_permissions(client, self._pin)
-            _LOGGER.debug("Connected with permissions %s", pers)
+            try:
+                pers = await get_permissions(client, self._pin)
+                _LOGGER.debug("Connected with permissions %s", pers)
+                await self._setup_notifications(client)
+            except BaseException:
+                # without a session nobody would close this connection
+                await client.disconnect()
+                raise
             self._session_data = _VogelsMotionMountSessionData(
                 client=client,
                 permissions=pers,
             )
-            await self._setup_notifications(client)
             self._permission_callback(self._session_data.permissions)
-            self._connection_callback(self._session_data.client.is_connected)
+            # establish_connection only returns connected clients
+            self._connection_callback(True)
             return self._session_data
 
     def _handle_disconnect(self, _: BleakClient):
@@ -363,15 +415,20 @@ class VogelsMotionMountBluetoothClient:
         session_data = await self._connect()
         if not self._has_write_permission(char_uuid, session_data.permissions):
             raise VogelsMotionMountClientAuthenticationError(cooldown=0)
-        await session_data.client.write_gatt_char(char_uuid, data)
+        if char_uuid in _MOVEMENT_UUIDS and _supports_write_without_response(
+            session_data.client, char_uuid
+        ):
+            await session_data.client.write_gatt_char(char_uuid, data, response=False)
+        else:
+            await session_data.client.write_gatt_char(char_uuid, data)
         _LOGGER.debug("Wrote data %s | %s", char_uuid, data)
 
     def _has_write_permission(
         self, char_uuid: str, permissions: VogelsMotionMountPermissions
     ) -> bool:
         return (
-            (char_uuid == CHAR_PRESET_UUIDS and permissions.change_presets)
-            or (char_uuid == CHAR_PRESET_NAMES_UUIDS and permissions.change_presets)
+            (char_uuid in CHAR_PRESET_UUIDS and permissions.change_presets)
+            or (char_uuid in CHAR_PRESET_NAMES_UUIDS and permissions.change_presets)
             or (char_uuid == CHAR_NAME_UUID and permissions.change_name)
             or (char_uuid == CHAR_DISABLE_CHANNEL and permissions.disable_channel)
             or (
@@ -387,24 +444,22 @@ class VogelsMotionMountBluetoothClient:
 
     async def _setup_notifications(self, client: BleakClient):
         """Setup notifications for distance and rotation changes."""
-        await client.start_notify(
-            char_specifier=CHAR_DISTANCE_UUID,
-            callback=self._handle_distance_change,
-        )
-        await client.start_notify(
-            char_specifier=CHAR_ROTATION_UUID,
-            callback=self._handle_rotation_change,
+        await asyncio.gather(
+            *(
+                client.start_notify(char_specifier=char_uuid, callback=handler)
+                for char_uuid, handler in self._notification_handlers.items()
+            )
         )
 
-    def _handle_distance_change(
-        self, _: BleakGATTCharacteristic | None, data: bytearray
-    ):
-        self._distance_callback(int.from_bytes(data, "big"))
-
-    def _handle_rotation_change(
-        self, _: BleakGATTCharacteristic | None, data: bytearray
+    @staticmethod
+    def _handle_notification(
+        value_struct: struct.Struct,
+        callback: Callable[[int], None],
+        _: BleakGATTCharacteristic | None,
+        data: bytearray,
     ):
-        self._rotation_callback(int.from_bytes(data, "big", signed=True))
+        (value,) = value_struct.unpack_from(data)
+        callback(value)
 
     # -------------------------------
     # region Permission
@@ -453,7 +508,7 @@ async def _get_max_auth_status(
     if current_auth_type.auth_type != VogelsMotionMountAuthenticationType.Wrong:
         return current_auth_type
 
-    authorised_user_pin_data = pin.to_bytes(2, "little")
+    authorised_user_pin_data = _PIN.pack(pin)
     await client.write_gatt_char(CHAR_AUTHENTICATE_UUID, authorised_user_pin_data)
     return await _get_auth_status(client)
 
@@ -478,7 +533,7 @@ async def _get_auth_status(
     # check if there was a wrong pin and therefore cooldown is active
     return VogelsMotionMountAuthenticationStatus(
         auth_type=VogelsMotionMountAuthenticationType.Wrong,
-        cooldown=max(0, 3 * (struct.unpack("<I", _auth_info)[0]) - 10),
+        cooldown=max(0, 3 * _COOLDOWN.unpack(_auth_info)[0] - 10),
     )
 
 
@@ -486,7 +541,11 @@ async def _read_multi_pin_features_directly(
     client: BleakClient,
 ) -> VogelsMotionMountMultiPinFeatures:
     """Read multi pin features directly without connecting first."""
-    data = (await client.read_gatt_char(CHAR_MULTI_PIN_FEATURES_UUID))[0]
+    data = await client.read_gatt_char(CHAR_MULTI_PIN_FEATURES_UUID)
+    return _decode_multi_pin_features(data[0])
+
+
+def _decode_multi_pin_features(data: int) -> VogelsMotionMountMultiPinFeatures:
     return VogelsMotionMountMultiPinFeatures(
         change_presets=bool(data & (1 << 0)),
         change_name=bool(data & (1 << 1)),
@@ -497,8 +556,17 @@ async def _read_multi_pin_features_directly(
     )
 
 
+def _supports_write_without_response(client: BleakClient, char_uuid: str) -> bool:
+    """Check if the characteristic can be written without waiting for a response."""
+    characteristic = client.services.get_characteristic(char_uuid)
+    return (
+        characteristic is not None
+        and "write-without-response" in characteristic.properties
+    )
+
+
 def _encode_supervisior_pin(pin: int) -> bytes:
-    return bytes([pin & 0xFF, (((pin >> 8) & 0xFF) + 0x40) & 0xFF])
+    return _PIN.pack((pin + _SUPERVISIOR_PIN_OFFSET) & 0xFFFF)
 
 
 @dataclass
@@ -141,8 +141,12 @@ class VogelsMotionMountConfigFlow(ConfigFlow, domain=DOMAIN):
                 name=device.name or "Unknown Device",
             )
 
-            _LOGGER.debug("await get_permissions")
-            permissions = await get_permissions(client, user_input.get(CONF_PIN))
+            try:
+                _LOGGER.debug("await get_permissions")
+                permissions = await get_permissions(client, user_input.get(CONF_PIN))
+            finally:
+                # the probe connection is not reused, release the connection slot
+                await client.disconnect()
             _LOGGER.debug("get_permission returned %s", permissions)
             if (
                 permissions.auth_status.auth_type
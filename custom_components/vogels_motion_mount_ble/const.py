@@ -9,6 +9,8 @@ CONF_NAME = "conf_name"
 CONF_PIN = "conf_pin"
 CONF_ERROR = "base"
 BLE_CALLBACK = "unregister_ble_callback"
+# preset names are stored as utf-8 over the 20 byte preset and 17 byte name characteristic
+PRESET_NAME_MAX_BYTES = 32
 
 CHAR_NAME_UUID = "c005fa37-0651-4800-b000-000000000000"
 CHAR_WIDTH_UUID = "c005fa2b-0651-4800-b000-000000000000"
@@ -16,7 +18,7 @@ CHAR_DISTANCE_UUID = "c005fa00-0651-4800-b000-000000000000"
 CHAR_ROTATION_UUID = "c005fa01-0651-4800-b000-000000000000"
 CHAR_AUTOMOVE_UUID = "c005fa02-0651-4800-b000-000000000000"
 CHAR_FREEZE_UUID = "c005fa14-0651-4800-b000-000000000000"
-CHAR_PRESET_UUIDS = [
+CHAR_PRESET_UUIDS = (
     "c005fa0a-0651-4800-b000-000000000000",
     "c005fa0b-0651-4800-b000-000000000000",
     "c005fa0c-0651-4800-b000-000000000000",
@@ -24,8 +26,8 @@ CHAR_PRESET_UUIDS = [
     "c005fa0e-0651-4800-b000-000000000000",
     "c005fa0f-0651-4800-b000-000000000000",
     "c005fa10-0651-4800-b000-000000000000",
-]
-CHAR_PRESET_NAMES_UUIDS = [
+)
+CHAR_PRESET_NAMES_UUIDS = (
     "c005fa17-0651-4800-b000-000000000000",
     "c005fa18-0651-4800-b000-000000000000",
     "c005fa19-0651-4800-b000-000000000000",
@@ -33,7 +35,7 @@ CHAR_PRESET_NAMES_UUIDS = [
     "c005fa1b-0651-4800-b000-000000000000",
     "c005fa1c-0651-4800-b000-000000000000",
     "c005fa1d-0651-4800-b000-000000000000",
-]
+)
 CHAR_PRESET_UUID = "c005fa2a-0651-4800-b000-000000000000"
 CHAR_VERSIONS_CEB_UUID = "c005fa08-0651-4800-b000-000000000000"
 CHAR_VERSIONS_MCP_UUID = "c005fa34-0651-4800-b000-000000000000"
@@ -1,9 +1,13 @@
 """Coordinator for Vogels Motion Mount BLE integration in order to communicate with client."""
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import replace
 from datetime import timedelta
+from functools import partial
 import logging
+import threading
+from typing import Any
 
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import BleakConnectionError, BleakNotFoundError
@@ -15,15 +19,21 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    HomeAssistantError,
+    ServiceValidationError,
+)
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .client import (
     VogelsMotionMountBluetoothClient,
     VogelsMotionMountClientAuthenticationError,
 )
-from .const import CONF_MAC, CONF_PIN, DOMAIN
+from .const import CONF_MAC, CONF_PIN, DOMAIN, PRESET_NAME_MAX_BYTES
 from .data import (
     VogelsMotionMountAuthenticationType,
     VogelsMotionMountAutoMoveType,
@@ -38,6 +48,13 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
+UPDATE_INTERVAL = timedelta(minutes=5)
+# upper bound of the backoff while the device can not be reached
+MAX_UPDATE_INTERVAL = timedelta(hours=1)
+
+# minimum time between two state updates caused by notifications
+NOTIFICATION_COOLDOWN = 0.1
+
 
 class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountData]):
     """Vogels Motion Mount BLE coordinator."""
@@ -75,9 +92,34 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
             _LOGGER,
             name=config_entry.title,
             config_entry=config_entry,
-            update_interval=timedelta(minutes=5),
+            update_interval=UPDATE_INTERVAL,
+            # only notify entities if a refresh actually changed the data
+            always_update=False,
+        )
+
+        # Coalesce bursts of notifications while the mount is moving and the
+        # permission and connection changes reported together on connect
+        self._pending_changes: dict[str, Any] = {}
+        self._notification_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=NOTIFICATION_COOLDOWN,
+            immediate=True,
+            function=self._publish_pending_changes,
         )
 
+        # A new session sends no initial notifications, the next refresh reads
+        # the notified values once before relying on notifications again
+        self._full_read_pending = True
+
+        # Only the latest of the movement requests queued during a write is sent,
+        # all callers it superseded share the outcome of that send
+        self._pending_requests: dict[str, tuple[int, asyncio.Future[None]]] = {}
+        self._request_locks = {
+            "requested_distance": asyncio.Lock(),
+            "requested_rotation": asyncio.Lock(),
+        }
+
         # Setup listeners
         self._unsub_options_update_listener = unsub_options_update_listener
         self._unsub_unavailable_update_listener = bluetooth.async_track_unavailable(
@@ -95,6 +137,11 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
     def _available_callback(
         self, info: BluetoothServiceInfoBleak, change: BluetoothChange
     ) -> None:
+        # reuse the device from the advertisement so reconnects do not need a new scan
+        self._client.update_device(info.device)
+        # advertisements arrive continuously, only reload once the device reappears
+        if self.data is not None and self.data.available:
+            return
         _LOGGER.debug("%s is discovered again", info.address)
         self.hass.async_create_task(self.async_request_refresh())  # load the data
 
@@ -108,6 +155,9 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         self._unsub_options_update_listener()
         self._unsub_unavailable_update_listener()
         self._unsub_available_update_listener()
+        # stop scheduled and pending refreshes so they do not reconnect afterwards
+        await self.async_shutdown()
+        self._notification_debouncer.async_shutdown()
         await self._client.disconnect()
 
     async def refresh_data(self):
@@ -136,13 +186,15 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
 
     async def request_distance(self, distance: int):
         """Request a distance to move to."""
-        await self._call(self._client.request_distance, distance)
-        self.async_set_updated_data(replace(self.data, requested_distance=distance))
+        await self._request_latest(
+            "requested_distance", self._client.request_distance, distance
+        )
 
     async def request_rotation(self, rotation: int):
         """Request a rotation to move to."""
-        await self._call(self._client.request_rotation, rotation)
-        self.async_set_updated_data(replace(self.data, requested_rotation=rotation))
+        await self._request_latest(
+            "requested_rotation", self._client.request_rotation, rotation
+        )
 
     async def set_authorised_user_pin(self, pin: str):
         """Set or remove pin for authorised user."""
@@ -174,7 +226,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         """Set type of automove."""
         await self._call(self._client.set_automove, automove)
         actual = await self._call(self._client.read_automove)
-        self.async_set_updated_data(replace(self.data, automove=actual))
+        self._update(automove=actual)
         if actual != automove:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -189,7 +241,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         """Set a preset to move to when automove is executed."""
         await self._call(self._client.set_freeze_preset, preset_index)
         actual = await self._call(self._client.read_freeze_preset_index)
-        self.async_set_updated_data(replace(self.data, freeze_preset_index=actual))
+        self._update(freeze_preset_index=actual)
         if actual != preset_index:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -204,7 +256,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         """Set features the authorised user is eligible to change."""
         await self._call(self._client.set_multi_pin_features, features)
         actual = await self._call(self._client.read_multi_pin_features)
-        self.async_set_updated_data(replace(self.data, multi_pin_features=actual))
+        self._update(multi_pin_features=actual)
         if actual != features:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -219,7 +271,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         """Set name of the Vogels Motion Mount."""
         await self._call(self._client.set_name, name)
         actual = await self._call(self._client.read_name)
-        self.async_set_updated_data(replace(self.data, name=actual))
+        self._update(name=actual)
         if actual != name:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -232,11 +284,26 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
 
     async def set_preset(self, preset: VogelsMotionMountPreset):
         """Set the data of a preset."""
+        if preset.data is not None:
+            # the limit is in bytes, multibyte characters would be cut otherwise
+            name_length = len(preset.data.name.encode("utf-8"))
+            if name_length > PRESET_NAME_MAX_BYTES:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="invalid_name",
+                    translation_placeholders={
+                        "name": preset.data.name,
+                        "actual": str(name_length),
+                        "expected": str(PRESET_NAME_MAX_BYTES),
+                    },
+                )
         await self._call(self._client.set_preset, preset)
         actual = await self._call(self._client.read_preset, preset.index)
-        presets = self.data.presets.copy()
-        presets[preset.index] = actual
-        self.async_set_updated_data(replace(self.data, presets=presets))
+        # only copy the presets if the written one actually changed
+        if actual != self.data.presets[preset.index]:
+            presets = self.data.presets.copy()
+            presets[preset.index] = actual
+            self.async_set_updated_data(replace(self.data, presets=presets))
         if actual != preset:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -277,7 +344,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         """Set the width of the tv."""
         await self._call(self._client.set_tv_width, width)
         actual = await self._call(self._client.read_tv_width)
-        self.async_set_updated_data(replace(self.data, tv_width=actual))
+        self._update(tv_width=actual)
         if actual != width:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -293,83 +360,212 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
     # -------------------------------
 
     def _permissions_changed(self, permissions: VogelsMotionMountPermissions):
-        if self.data is not None:
-            _LOGGER.debug("_permissions_changed %s", permissions)
-            self.async_set_updated_data(replace(self.data, permissions=permissions))
-        self._check_permission_status(permissions)
+        _LOGGER.debug("_permissions_changed %s", permissions)
+        # only record the permissions, raising here would abort the client's connect
+        # before setup or refresh can check the auth status including its cooldown
+        self._queue_changes(permissions=permissions)
 
     def _connection_changed(self, connected: bool):
-        if self.data is not None:
-            self.async_set_updated_data(replace(self.data, connected=connected))
+        _LOGGER.debug("_connection_changed %s", connected)
+        if connected:
+            self._full_read_pending = True
+        self._queue_changes(connected=connected)
 
     def _distance_changed(self, distance: int):
         _LOGGER.debug("_distance_changed %s", distance)
-        if self.data is not None:
-            self.async_set_updated_data(replace(self.data, distance=distance))
+        self._queue_changes(distance=distance)
 
     def _rotation_changed(self, rotation: int):
         _LOGGER.debug("_rotation_changed %s", rotation)
-        if self.data is not None:
-            self.async_set_updated_data(replace(self.data, rotation=rotation))
+        self._queue_changes(rotation=rotation)
+
+    def _queue_changes(self, **changes: Any):
+        """Collect notified changes and publish them at most once per cooldown."""
+        if threading.get_ident() != self.hass.loop_thread_id:
+            # some bleak backends deliver notifications from their own thread
+            self.hass.loop.call_soon_threadsafe(partial(self._queue_changes, **changes))
+            return
+        if not self._pending_changes:
+            # changes reported within the same loop iteration are published together
+            self.hass.loop.call_soon(self._notification_debouncer.async_schedule_call)
+        self._pending_changes.update(changes)
+
+    @callback
+    def _publish_pending_changes(self):
+        changes, self._pending_changes = self._pending_changes, {}
+        self._update(**changes)
+
+    def _update(self, **changes: Any):
+        """Publish the changed data, skipping updates that do not change anything."""
+        if self.data is None or all(
+            getattr(self.data, key) == value for key, value in changes.items()
+        ):
+            return
+        self.async_set_updated_data(replace(self.data, **changes))
 
     # -------------------------------
     # region internal
     # -------------------------------
 
+    async def _async_setup(self) -> None:
+        """Authenticate once before the first refresh and fail setup on a wrong pin."""
+        try:
+            permissions = await self._client.read_permissions()
+        except VogelsMotionMountClientAuthenticationError as err:
+            _LOGGER.debug("_async_setup ConfigEntryAuthFailed %s", err)
+            raise ConfigEntryAuthFailed from err
+        except (BleakConnectionError, BleakNotFoundError) as err:
+            _LOGGER.debug("_async_setup device not found %s", err)
+            raise UpdateFailed(translation_key="error_device_not_found") from err
+        try:
+            self._check_permission_status(permissions)
+        except ConfigEntryAuthFailed:
+            # the rejected session stays connected otherwise, setup discards this coordinator
+            await self._disconnect_and_set_unavailable()
+            raise
+
     async def _async_update_data(self) -> VogelsMotionMountData:
         """Fetch data from device."""
+        if not self._client.is_connected:
+            # the device object given at setup may be stale, connect with the latest known one
+            device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
+            )
+            if device is not None:
+                self._client.update_device(device)
         try:
             permissions = await self._client.read_permissions()
             self._check_permission_status(permissions)
 
+            # within a session distance and rotation are kept up to date by notifications
+            full_read = self._full_read_pending or self.data is None
+            distance = rotation = versions = None
+            if full_read:
+                # the firmware versions can only change with a reconnect
+                distance, rotation, versions = await asyncio.gather(
+                    self._client.read_distance(),
+                    self._client.read_rotation(),
+                    self._client.read_versions(),
+                )
+                self._full_read_pending = False
+
+            # independent characteristics, issue the reads concurrently
+            (
+                automove,
+                freeze_preset_index,
+                multi_pin_features,
+                name,
+                pin_setting,
+                presets,
+                tv_width,
+            ) = await asyncio.gather(
+                self._client.read_automove(),
+                self._client.read_freeze_preset_index(),
+                self._client.read_multi_pin_features(),
+                self._client.read_name(),
+                self._client.read_pin_settings(),
+                self._client.read_presets(),
+                self._client.read_tv_width(),
+            )
+
+            if not full_read:
+                # take the notified values only now, they may have changed during the reads
+                distance, rotation = self.data.distance, self.data.rotation
+                versions = self.data.versions
+
+            # device is reachable again, stop backing off
+            self.update_interval = UPDATE_INTERVAL
             return VogelsMotionMountData(
-                automove=await self._client.read_automove(),
+                automove=automove,
                 available=True,
-                connected=self.data.connected if self.data is not None else False,
-                distance=await self._client.read_distance(),
-                freeze_preset_index=await self._client.read_freeze_preset_index(),
-                multi_pin_features=await self._client.read_multi_pin_features(),
-                name=await self._client.read_name(),
-                pin_setting=await self._client.read_pin_settings(),
-                presets=await self._client.read_presets(),
-                rotation=await self._client.read_rotation(),
-                tv_width=await self._client.read_tv_width(),
-                versions=await self._client.read_versions(),
+                connected=self._client.is_connected,
+                distance=distance,
+                freeze_preset_index=freeze_preset_index,
+                multi_pin_features=multi_pin_features,
+                name=name,
+                pin_setting=pin_setting,
+                presets=presets,
+                rotation=rotation,
+                tv_width=tv_width,
+                versions=versions,
                 permissions=permissions,
             )
         except VogelsMotionMountClientAuthenticationError as err:
             await self._disconnect_and_set_unavailable()
             # reraise auth issues
-            _LOGGER.debug("_async_update_data ConfigEntryAuthFailed %s", str(err))
+            _LOGGER.debug("_async_update_data ConfigEntryAuthFailed %s", err)
             raise ConfigEntryAuthFailed from err
+        except ConfigEntryAuthFailed:
+            # rejected pin, keep the reauth error instead of reporting a failed update
+            await self._disconnect_and_set_unavailable()
+            raise
         except BleakConnectionError as err:
             await self._disconnect_and_set_unavailable()
+            self._back_off()
             # treat BleakConnectionError as device not found
             raise UpdateFailed(translation_key="error_device_not_found") from err
         except BleakNotFoundError as err:
             await self._disconnect_and_set_unavailable()
-            _LOGGER.debug("_async_update_data BleakNotFoundError %s", str(err))
+            self._back_off()
+            _LOGGER.debug("_async_update_data BleakNotFoundError %s", err)
             # treat BleakNotFoundError as device not found
             raise UpdateFailed(translation_key="error_device_not_found") from err
         except Exception as err:
             await self._disconnect_and_set_unavailable()
+            self._back_off()
             # Device unreachable → tell HA gracefully
-            _LOGGER.debug("_async_update_data Exception %s", repr(err))
+            _LOGGER.debug("_async_update_data Exception %r", err)
             raise UpdateFailed(
                 translation_key="error_unknown",
                 translation_placeholders={"error": repr(err)},
             ) from err
 
     def _check_permission_status(self, permissions: VogelsMotionMountPermissions):
+        auth_status = permissions.auth_status
         if (
-            permissions.auth_status is not None
-            and permissions.auth_status.auth_type
-            == VogelsMotionMountAuthenticationType.Wrong
+            auth_status is None
+            or auth_status.auth_type != VogelsMotionMountAuthenticationType.Wrong
         ):
-            _LOGGER.debug(
-                "Authentication failed with auth status %s", permissions.auth_status
+            return
+        _LOGGER.debug("Authentication failed with auth status %s", auth_status)
+        if auth_status.cooldown and auth_status.cooldown > 0:
+            retry_time = dt_util.now() + timedelta(seconds=auth_status.cooldown)
+            raise ConfigEntryAuthFailed(
+                translation_key="error_invalid_authentication_cooldown",
+                translation_placeholders={
+                    "retry_at": retry_time.strftime("%Y-%m-%d %H:%M:%S")
+                },
             )
-            raise ConfigEntryAuthFailed(translation_key="error_invalid_authentication")
+        raise ConfigEntryAuthFailed(translation_key="error_invalid_authentication")
+
+    async def _request_latest(self, field: str, func, value: int):
+        """Send a movement request, skipping requests superseded while waiting."""
+        if (pending := self._pending_requests.get(field)) is not None:
+            # replace the value still waiting to be sent and report the result of its send
+            result = pending[1]
+            self._pending_requests[field] = (value, result)
+            await asyncio.shield(result)
+            return
+
+        result = self.hass.loop.create_future()
+        self._pending_requests[field] = (value, result)
+        try:
+            async with self._request_locks[field]:
+                value, _ = self._pending_requests.pop(field)
+                await self._call(func, value)
+                self._update(**{field: value})
+        except HomeAssistantError as err:
+            result.set_exception(err)
+        else:
+            result.set_result(None)
+        finally:
+            if not result.done():
+                # cancelled before sending, do not leave the sharing callers waiting
+                pending = self._pending_requests.get(field)
+                if pending is not None and pending[1] is result:
+                    del self._pending_requests[field]
+                result.cancel()
+        await result
 
     async def _call(self, func, *args, **kwargs):
         """Execute a BLE client call safely."""
@@ -377,7 +573,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
             return await func(*args, **kwargs)
         except VogelsMotionMountClientAuthenticationError as err:
             # reraise auth issues
-            _LOGGER.debug("_async_update_data ConfigEntryAuthFailed %s", str(err))
+            _LOGGER.debug("_async_update_data ConfigEntryAuthFailed %s", err)
             raise ConfigEntryAuthFailed from err
         except BleakConnectionError as err:
             await self._disconnect_and_set_unavailable()
@@ -387,7 +583,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
             ) from err
         except BleakNotFoundError as err:
             await self._disconnect_and_set_unavailable()
-            _LOGGER.debug("_async_update_data BleakNotFoundError %s", str(err))
+            _LOGGER.debug("_async_update_data BleakNotFoundError %s", err)
             # treat BleakNotFoundError as device not found
             raise ServiceValidationError(
                 translation_key="error_device_not_found"
@@ -395,7 +591,7 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         except Exception as err:
             await self._disconnect_and_set_unavailable()
             # Device unreachable → tell HA gracefully
-            _LOGGER.debug("_async_update_data Exception %s", repr(err))
+            _LOGGER.debug("_async_update_data Exception %r", err)
             raise ServiceValidationError(
                 translation_key="error_unknown",
                 translation_placeholders={"error": repr(err)},
@@ -405,15 +601,19 @@ class VogelsMotionMountBleCoordinator(DataUpdateCoordinator[VogelsMotionMountDat
         try:
             await self.disconnect()
         except Exception as err:  # noqa: BLE001
-           _LOGGER.debug("disconnect_and_set_unavailable disconnect Exception %s", repr(err))
+            _LOGGER.debug("disconnect_and_set_unavailable disconnect Exception %r", err)
 
         self._set_unavailable()
 
     def _set_unavailable(self):
-        _LOGGER.debug("_set_unavailable with data %s", str(self.data))
+        _LOGGER.debug("_set_unavailable with data %s", self.data)
         # trigger rediscovery for the device
         bluetooth.async_rediscover_address(self.hass, self.config_entry.data[CONF_MAC])
         if self.data is None:  # may be called before data is available
             return
         # tell HA to refresh all entities
-        self.async_set_updated_data(replace(self.data, available=False))
+        self._update(available=False)
+
+    def _back_off(self):
+        # slow down polling after a failed refresh, a reappearing device triggers a refresh on its own
+        self.update_interval = min(self.update_interval * 2, MAX_UPDATE_INTERVAL)
@@ -45,7 +45,7 @@ class VogelsMotionMountAuthenticationStatus:
     cooldown: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VogelsMotionMountPreset:
     """Preset data."""
 
@@ -53,7 +53,7 @@ class VogelsMotionMountPreset:
     data: VogelsMotionMountPresetData | None
 
 
-@dataclass
+@dataclass(slots=True)
 class VogelsMotionMountPresetData:
     """Preset data."""
 
@@ -84,9 +84,9 @@ class VogelsMotionMountVersions:
     mcp_hw_version: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VogelsMotionMountData:
-    """Holds the data of the device."""
+    """Holds an immutable snapshot of the device data, changed via replace()."""
 
     automove: VogelsMotionMountAutoMoveType
     available: bool
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
 import pytest
 
 from custom_components.vogels_motion_mount_ble.client import (
@@ -27,6 +28,7 @@ from custom_components.vogels_motion_mount_ble.const import (
     CHAR_NAME_UUID,
     CHAR_PIN_SETTINGS_UUID,
     CHAR_PRESET_NAMES_UUIDS,
+    CHAR_PRESET_UUID,
     CHAR_PRESET_UUIDS,
     CHAR_ROTATION_UUID,
     CHAR_VERSIONS_CEB_UUID,
@@ -86,6 +88,7 @@ def mock_ble_client() -> BleakClient:
     client.write_gatt_char = AsyncMock()
     client.start_notify = AsyncMock()
     client.disconnect = AsyncMock()
+    client.services = MagicMock()
     client.is_connected = True
     return client
 
@@ -271,6 +274,20 @@ async def test_read_rotation(
     assert rotation == 25
 
 
+@pytest.mark.asyncio
+async def test_read_rotation_negative(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """Reading rotation decodes rotations to the left as negative values."""
+    client._connect = AsyncMock(return_value=mock_session)  # noqa: SLF001
+    mock_session.client.read_gatt_char.return_value = (-25).to_bytes(
+        2, "big", signed=True
+    )
+    rotation = await client.read_rotation()
+    assert rotation == -25
+
+
 @pytest.mark.asyncio
 async def test_read_tv_width(
     client: VogelsMotionMountBluetoothClient,
@@ -349,6 +366,21 @@ async def test_disconnect(
     mock_session.client.disconnect.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_disconnect_waits_for_pending_connect(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """Disconnect is serialized with a connection attempt in progress."""
+    async with client._connect_lock:  # noqa: SLF001
+        task = asyncio.create_task(client.disconnect())
+        await asyncio.sleep(0)
+        assert not task.done()
+        client._session_data = mock_session  # noqa: SLF001
+    await task
+    mock_session.client.disconnect.assert_awaited_once()
+
+
 # -------------------------------
 # region Write tests
 # -------------------------------
@@ -380,6 +412,29 @@ async def test_request_rotation_writes(
     )
 
 
+@pytest.mark.asyncio
+async def test_movement_writes_without_response_if_supported(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """Movement requests skip the write response if the characteristic allows it."""
+    client._connect = AsyncMock(return_value=mock_session)  # noqa: SLF001
+    mock_session.client.services.get_characteristic.return_value.properties = [
+        "write",
+        "write-without-response",
+    ]
+    await client.request_distance(55)
+    mock_session.client.write_gatt_char.assert_called_once_with(
+        CHAR_DISTANCE_UUID, (55).to_bytes(2, "big"), response=False
+    )
+
+    mock_session.client.write_gatt_char.reset_mock()
+    await client.select_preset(3)
+    mock_session.client.write_gatt_char.assert_called_once_with(
+        CHAR_PRESET_UUID, bytes([3]), response=False
+    )
+
+
 @pytest.mark.asyncio
 async def test_set_authorised_user_pin_writes(
     client: VogelsMotionMountBluetoothClient,
@@ -470,10 +525,48 @@ async def test_set_preset_writes(
     second_args, _ = mock_session.client.write_gatt_char.call_args_list[1]
     assert first_args[0] == CHAR_PRESET_UUIDS[preset.index]
     assert len(first_args[1]) == 20
+    assert first_args[1][:9] == b"\x01\x00\x21\xff\xf4Room"
     assert second_args[0] == CHAR_PRESET_NAMES_UUIDS[preset.index]
     assert len(second_args[1]) == 17
 
 
+@pytest.mark.asyncio
+async def test_set_preset_stops_after_failed_write(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """The preset name is not written when writing the preset itself failed."""
+    client._connect = AsyncMock(return_value=mock_session)  # noqa: SLF001
+    mock_session.client.write_gatt_char.side_effect = RuntimeError("boom")
+    preset = VogelsMotionMountPreset(
+        index=1,
+        data=VogelsMotionMountPresetData(name="Room", distance=33, rotation=-12),
+    )
+    with pytest.raises(RuntimeError):
+        await client.set_preset(preset)
+    mock_session.client.write_gatt_char.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_preset_multibyte_name_at_limit_reads_back(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """A multibyte name filling all 32 bytes is written completely and read back."""
+    client._connect = AsyncMock(return_value=mock_session)  # noqa: SLF001
+    preset = VogelsMotionMountPreset(
+        index=1,
+        data=VogelsMotionMountPresetData(name="Ä" * 16, distance=33, rotation=-12),
+    )
+    await client.set_preset(preset)
+    written = [
+        args[1] for args, _ in mock_session.client.write_gatt_char.call_args_list
+    ]
+
+    mock_session.client.read_gatt_char.side_effect = written
+    assert await client.read_preset(1) == preset
+
+
 @pytest.mark.asyncio
 async def test_set_preset_with_none_data_writes(
     client: VogelsMotionMountBluetoothClient,
@@ -614,7 +707,55 @@ async def test_connect_sets_session_and_triggers_callbacks(mock_dev):
         session = await client._connect()  # noqa: SLF001
         assert isinstance(session, _VogelsMotionMountSessionData)
         permission_cb.assert_called_once_with(mock_perms)
-        connection_cb.assert_called_once_with(mock_client.is_connected)
+        connection_cb.assert_called_once_with(True)
+
+
+@pytest.mark.asyncio
+async def test_connect_uses_latest_device(
+    client: VogelsMotionMountBluetoothClient, mock_dev: BLEDevice
+):
+    """Ensure retries of establish_connection use the latest known device."""
+    new_dev = BLEDevice(address=MOCKED_CONF_MAC, name=MOCKED_CONF_NAME, details={})
+    establish_connection = AsyncMock()
+    with (
+        patch(
+            "custom_components.vogels_motion_mount_ble.client.establish_connection",
+            establish_connection,
+        ),
+        patch(
+            "custom_components.vogels_motion_mount_ble.client.get_permissions",
+            AsyncMock(),
+        ),
+    ):
+        await client._connect()  # noqa: SLF001
+        ble_device_callback = establish_connection.call_args.kwargs[
+            "ble_device_callback"
+        ]
+        assert ble_device_callback() is mock_dev
+        client.update_device(new_dev)
+        assert ble_device_callback() is new_dev
+
+
+@pytest.mark.asyncio
+async def test_connect_disconnects_on_failed_session_setup(
+    client: VogelsMotionMountBluetoothClient,
+):
+    """Ensure a connection is closed again if the session can not be set up."""
+    mock_client = AsyncMock(spec=BleakClient)
+    with (
+        patch(
+            "custom_components.vogels_motion_mount_ble.client.establish_connection",
+            return_value=mock_client,
+        ),
+        patch(
+            "custom_components.vogels_motion_mount_ble.client.get_permissions",
+            AsyncMock(side_effect=BleakError("read failed")),
+        ),
+        pytest.raises(BleakError),
+    ):
+        await client._connect()  # noqa: SLF001
+    mock_client.disconnect.assert_awaited_once()
+    assert client._session_data is None  # noqa: SLF001
 
 
 def test_handle_disconnect_resets_session_and_triggers_callback(mock_dev):
@@ -629,8 +770,10 @@ def test_handle_disconnect_resets_session_and_triggers_callback(mock_dev):
         rotation_callback=lambda _: None,
     )
     client._session_data = MagicMock()  # noqa: SLF001
+    assert client.is_connected is True
     client._handle_disconnect(MagicMock(spec=BleakClient))  # noqa: SLF001
     assert client._session_data is None  # noqa: SLF001
+    assert client.is_connected is False
     connection_cb.assert_called_once_with(False)
 
 
@@ -660,7 +803,8 @@ async def test_distance_callback_fires(
     client: VogelsMotionMountBluetoothClient, callbacks
 ):
     """Distance callback is called when notification arrives."""
-    client._handle_distance_change(None, (10).to_bytes(2, "big"))  # noqa: SLF001
+    handler = client._notification_handlers[CHAR_DISTANCE_UUID]  # noqa: SLF001
+    handler(None, (10).to_bytes(2, "big"))
     callbacks["distance"].assert_called_once_with(10)
 
 
@@ -669,7 +813,8 @@ async def test_rotation_callback_fires(
     client: VogelsMotionMountBluetoothClient, callbacks
 ):
     """Rotation callback is called when notification arrives."""
-    client._handle_rotation_change(None, (-20).to_bytes(2, "big", signed=True))  # noqa: SLF001
+    handler = client._notification_handlers[CHAR_ROTATION_UUID]  # noqa: SLF001
+    handler(None, (-20).to_bytes(2, "big", signed=True))
     callbacks["rotation"].assert_called_once_with(-20)
 
 
@@ -700,6 +845,27 @@ async def test_write_without_permission_raises(
         await client._write(CHAR_NAME_UUID, b"test")  # noqa: SLF001
 
 
+@pytest.mark.asyncio
+async def test_write_preset_with_preset_permission(
+    client: VogelsMotionMountBluetoothClient,
+    mock_session: _VogelsMotionMountSessionData,
+):
+    """Presets can be written with the change presets permission only."""
+    client._connect = AsyncMock(return_value=mock_session)  # noqa: SLF001
+    mock_session.permissions = VogelsMotionMountPermissions(
+        auth_status=None,
+        change_name=False,
+        change_presets=True,
+        change_settings=False,
+        change_tv_on_off_detection=False,
+        disable_channel=False,
+        change_default_position=False,
+        start_calibration=False,
+    )
+    await client.set_preset(VogelsMotionMountPreset(index=2, data=None))
+    assert mock_session.client.write_gatt_char.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_permissions_full_returns_all_true():
     """Ensure get_permissions returns all permissions True when auth is Full."""
@@ -894,3 +1060,9 @@ async def test_read_multi_pin_features_directly_maps_bits():
     assert result.change_default_position
     assert not result.change_name
     assert not result.change_tv_on_off_detection
+
+
+def test_encode_supervisior_pin_offsets_high_byte():
+    """Ensure the supervisior pin is little endian with the high byte offset by 64."""
+    assert _encode_supervisior_pin(1234) == bytes([0xD2, 0x44])
+    assert _encode_supervisior_pin(9999) == bytes([0x0F, 0x67])
@@ -223,6 +223,31 @@ async def test_user_flow_connection_error(
     assert configure_result["errors"][CONF_ERROR] == "error_unknown"
 
 
+@pytest.mark.asyncio
+@patch("custom_components.vogels_motion_mount_ble.config_flow.establish_connection")
+@patch("custom_components.vogels_motion_mount_ble.config_flow.get_permissions")
+async def test_user_flow_disconnects_probe_client(
+    mock_get_permissions: AsyncMock,
+    mock_establish_connection: AsyncMock,
+    hass: HomeAssistant,
+) -> None:
+    """Test the connection used for validation is closed even if it fails."""
+    client = AsyncMock()
+    mock_establish_connection.return_value = client
+    mock_get_permissions.side_effect = Exception("Read failed")
+
+    flow_result: dict[str, Any] = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    configure_result: dict[str, Any] = await hass.config_entries.flow.async_configure(
+        flow_result["flow_id"],
+        MOCKED_CONFIG,
+    )
+
+    assert configure_result["errors"][CONF_ERROR] == "error_unknown"
+    client.disconnect.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_user_flow_unknown_error(
     mock_conn: AsyncMock, hass: HomeAssistant
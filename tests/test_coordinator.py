@@ -1,18 +1,25 @@
 """Tests for the coordinator."""
 
+import asyncio
 from dataclasses import replace
-from unittest.mock import AsyncMock, MagicMock, Mock
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, call
 
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import BleakConnectionError, BleakNotFoundError
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.vogels_motion_mount_ble.client import (
     VogelsMotionMountBluetoothClient,
     VogelsMotionMountClientAuthenticationError,
 )
 from custom_components.vogels_motion_mount_ble.coordinator import (
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
     VogelsMotionMountBleCoordinator,
 )
 from custom_components.vogels_motion_mount_ble.data import (
@@ -29,6 +36,7 @@ from custom_components.vogels_motion_mount_ble.data import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 
 # Example fixtures (already split)
@@ -63,6 +71,8 @@ async def mock_client() -> VogelsMotionMountBluetoothClient:
     )
     client.read_freeze_preset_index.return_value = 0
     client.read_versions.return_value = None
+    client.update_device = Mock()
+    client.is_connected = False
     return client
 
 
@@ -123,6 +133,23 @@ async def test_available_and_unavailable_callbacks_without_data(
     coordinator._available_callback(MagicMock(), MagicMock())  # noqa: SLF001
 
 
+@pytest.mark.asyncio
+async def test_available_callback_skips_refresh_while_available(
+    coordinator: VogelsMotionMountBleCoordinator,
+):
+    """Test advertisements of an available device do not trigger a refresh."""
+    coordinator.async_request_refresh = AsyncMock()
+    info = MagicMock()
+
+    coordinator._available_callback(info, MagicMock())  # noqa: SLF001
+    coordinator.async_request_refresh.assert_not_called()
+    coordinator._client.update_device.assert_called_once_with(info.device)  # noqa: SLF001
+
+    coordinator.data = replace(coordinator.data, available=False)
+    coordinator._available_callback(MagicMock(), MagicMock())  # noqa: SLF001
+    coordinator.async_request_refresh.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_unload(
     coordinator: VogelsMotionMountBleCoordinator,
@@ -148,8 +175,10 @@ async def test_unload(
     coordinator._unsub_options_update_listener = unsub  # noqa: SLF001
     coordinator._unsub_unavailable_update_listener = unsub_unavailable  # noqa: SLF001
     coordinator._unsub_available_update_listener = unsub_available  # noqa: SLF001
+    coordinator.async_shutdown = AsyncMock()
 
     await coordinator.unload()
+    coordinator.async_shutdown.assert_awaited_once()
     mock_client.disconnect.assert_awaited()
     assert unsub_called
     assert unsub_unavailable
@@ -158,12 +187,14 @@ async def test_unload(
 
 @pytest.mark.asyncio
 async def test_refresh_data(
+    hass: HomeAssistant,
     coordinator: VogelsMotionMountBleCoordinator,
     mock_client: VogelsMotionMountBluetoothClient,
 ):
     """Test refresh data action."""
     await coordinator.refresh_data()
-    mock_client.read_distance.assert_awaited()
+    await hass.async_block_till_done()
+    mock_client.read_name.assert_awaited()
 
 
 @pytest.mark.asyncio
@@ -230,6 +261,66 @@ async def test_request_rotation(
     assert coordinator.data.requested_rotation == 15
 
 
+@pytest.mark.asyncio
+async def test_request_distance_skips_superseded_requests(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Requests queued behind a running write only send the latest value."""
+    release = asyncio.Event()
+
+    async def _request_distance(distance: int):
+        if distance == 10:
+            await release.wait()
+
+    mock_client.request_distance.side_effect = _request_distance
+
+    first = asyncio.create_task(coordinator.request_distance(10))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(coordinator.request_distance(distance))
+        for distance in (20, 30)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *queued)
+
+    assert mock_client.request_distance.await_args_list == [call(10), call(30)]
+    assert coordinator.data.requested_distance == 30
+
+
+@pytest.mark.asyncio
+async def test_request_distance_superseded_requests_share_failure(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Every request covered by a failed send reports the failure."""
+    release = asyncio.Event()
+
+    async def _request_distance(distance: int):
+        if distance == 10:
+            await release.wait()
+        else:
+            raise BleakConnectionError("boom")
+
+    mock_client.request_distance.side_effect = _request_distance
+
+    first = asyncio.create_task(coordinator.request_distance(10))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(coordinator.request_distance(distance))
+        for distance in (20, 30)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(first, *queued, return_exceptions=True)
+
+    assert mock_client.request_distance.await_args_list == [call(10), call(30)]
+    assert results[0] is None
+    assert all(isinstance(result, ServiceValidationError) for result in results[1:])
+    assert coordinator.data.requested_distance == 10
+
+
 @pytest.mark.asyncio
 async def test_set_authorised_user_pin_success(
     coordinator: VogelsMotionMountBleCoordinator,
@@ -366,6 +457,22 @@ async def test_set_preset_success(
     assert coordinator.data.presets[1] == preset
 
 
+@pytest.mark.asyncio
+async def test_set_preset_unchanged_does_not_update(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Test writing the current preset data again does not publish new data."""
+    preset = coordinator.data.presets[1]
+    mock_client.read_preset.return_value = preset
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.set_preset(preset)
+
+    mock_client.set_preset.assert_awaited_with(preset)
+    coordinator.async_set_updated_data.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_set_preset_failure(
     coordinator: VogelsMotionMountBleCoordinator,
@@ -385,6 +492,32 @@ async def test_set_preset_failure(
         await coordinator.set_preset(preset)
 
 
+@pytest.mark.asyncio
+async def test_set_preset_name_byte_limit(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Test preset names are limited by their utf-8 length, not their characters."""
+    # 17 characters but 33 bytes
+    preset = VogelsMotionMountPreset(
+        index=1,
+        data=VogelsMotionMountPresetData(name="a" + "Ä" * 16, distance=10, rotation=50),
+    )
+    with pytest.raises(ServiceValidationError) as err:
+        await coordinator.set_preset(preset)
+    assert err.value.translation_key == "invalid_name"
+    mock_client.set_preset.assert_not_awaited()
+
+    # 16 characters and exactly 32 bytes
+    preset = VogelsMotionMountPreset(
+        index=1,
+        data=VogelsMotionMountPresetData(name="Ä" * 16, distance=10, rotation=50),
+    )
+    mock_client.read_preset.return_value = preset
+    await coordinator.set_preset(preset)
+    mock_client.set_preset.assert_awaited_once_with(preset)
+
+
 @pytest.mark.asyncio
 async def test_set_supervisior_pin_success(
     coordinator: VogelsMotionMountBleCoordinator,
@@ -421,6 +554,20 @@ async def test_set_tv_width_success(
     assert coordinator.data.tv_width == 100
 
 
+@pytest.mark.asyncio
+async def test_set_tv_width_unchanged_does_not_update(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Test writing the current tv width again does not publish new data."""
+    mock_client.read_tv_width.return_value = coordinator.data.tv_width
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.set_tv_width(coordinator.data.tv_width)
+
+    coordinator.async_set_updated_data.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_set_tv_width_failure(
     coordinator: VogelsMotionMountBleCoordinator,
@@ -438,36 +585,369 @@ async def test_set_tv_width_failure(
 # -----------------------------
 
 
-def test_permissions_changed(coordinator: VogelsMotionMountBleCoordinator):
+@pytest.mark.asyncio
+async def test_permissions_changed(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
     """Test permission change callback."""
     new_perm = replace(coordinator.data.permissions, change_name=False)
     coordinator._permissions_changed(new_perm)  # noqa: SLF001
+    await hass.async_block_till_done()
     assert coordinator.data.permissions.change_name is False
 
 
-def test_connection_changed(coordinator: VogelsMotionMountBleCoordinator):
+@pytest.mark.asyncio
+async def test_connection_changed(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
     """Test connection change callback."""
+    coordinator.data = replace(coordinator.data, connected=False)
     coordinator._connection_changed(True)  # noqa: SLF001
+    await hass.async_block_till_done()
     assert coordinator.data.connected is True
 
 
-def test_distance_changed(coordinator: VogelsMotionMountBleCoordinator):
+@pytest.mark.asyncio
+async def test_connect_callbacks_are_published_once(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
+    """Test permission and connection changes of a connect result in one update."""
+    coordinator.data = replace(coordinator.data, connected=False)
+    coordinator.async_set_updated_data = MagicMock()
+    new_perm = replace(coordinator.data.permissions, change_name=False)
+
+    coordinator._permissions_changed(new_perm)  # noqa: SLF001
+    coordinator._connection_changed(True)  # noqa: SLF001
+    await hass.async_block_till_done()
+
+    coordinator.async_set_updated_data.assert_called_once()
+    data = coordinator.async_set_updated_data.call_args.args[0]
+    assert data.connected is True
+    assert data.permissions == new_perm
+
+
+@pytest.mark.asyncio
+async def test_distance_changed(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
     """Test permission change callback."""
     coordinator._distance_changed(42)  # noqa: SLF001
+    await hass.async_block_till_done()
     assert coordinator.data.distance == 42
 
 
-def test_rotation_changed(coordinator: VogelsMotionMountBleCoordinator):
+@pytest.mark.asyncio
+async def test_rotation_changed(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
     """Test rotation change callback."""
     coordinator._rotation_changed(90)  # noqa: SLF001
+    await hass.async_block_till_done()
     assert coordinator.data.rotation == 90
 
 
+@pytest.mark.asyncio
+async def test_notification_from_other_thread_is_handled_in_event_loop(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
+    """Test notifications delivered off the event loop are moved onto it."""
+    await hass.async_add_executor_job(coordinator._distance_changed, 7)  # noqa: SLF001
+    await hass.async_block_till_done()
+    assert coordinator.data.distance == 7
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_coalesced(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
+    """Test a burst of notifications results in a single trailing update."""
+    coordinator.async_set_updated_data = MagicMock(
+        side_effect=lambda data: setattr(coordinator, "data", data)
+    )
+
+    coordinator._distance_changed(1)  # noqa: SLF001
+    await hass.async_block_till_done()
+    coordinator.async_set_updated_data.assert_called_once()
+
+    coordinator._distance_changed(2)  # noqa: SLF001
+    coordinator._rotation_changed(3)  # noqa: SLF001
+    coordinator._distance_changed(4)  # noqa: SLF001
+    await hass.async_block_till_done()
+    coordinator.async_set_updated_data.assert_called_once()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert coordinator.async_set_updated_data.call_count == 2
+    assert coordinator.data.distance == 4
+    assert coordinator.data.rotation == 3
+
+
+@pytest.mark.asyncio
+async def test_unchanged_notification_is_not_published(
+    hass: HomeAssistant, coordinator: VogelsMotionMountBleCoordinator
+):
+    """Test a notification repeating the current value does not update entities."""
+    coordinator.async_set_updated_data = MagicMock()
+
+    coordinator._distance_changed(coordinator.data.distance)  # noqa: SLF001
+    await hass.async_block_till_done()
+
+    coordinator.async_set_updated_data.assert_not_called()
+
+
 # -------------------------------
 # region internal
 # -------------------------------
 
 
+@pytest.mark.asyncio
+async def test_async_setup_accepts_valid_permissions(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Setup succeeds if the pin is not rejected."""
+    await coordinator._async_setup()  # noqa: SLF001
+    mock_client.read_permissions.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cooldown", [0, 120])
+async def test_async_setup_raises_entryauthfailed_on_wrong_pin(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+    cooldown: int,
+):
+    """Setup fails with ConfigEntryAuthFailed if the pin is rejected."""
+    mock_client.read_permissions.return_value = replace(
+        mock_client.read_permissions.return_value,
+        auth_status=VogelsMotionMountAuthenticationStatus(
+            auth_type=VogelsMotionMountAuthenticationType.Wrong,
+            cooldown=cooldown,
+        ),
+    )
+
+    with pytest.raises(ConfigEntryAuthFailed) as exc_info:
+        await coordinator._async_setup()  # noqa: SLF001
+
+    placeholders = exc_info.value.translation_placeholders or {}
+    assert ("retry_at" in placeholders) == (cooldown > 0)
+    mock_client.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("refresh", [False, True])
+async def test_wrong_pin_reported_by_client_keeps_cooldown(
+    hass: HomeAssistant,
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+    refresh: bool,
+):
+    """The permission callback fired while connecting does not hide the cooldown."""
+    wrong_permissions = replace(
+        mock_client.read_permissions.return_value,
+        auth_status=VogelsMotionMountAuthenticationStatus(
+            auth_type=VogelsMotionMountAuthenticationType.Wrong,
+            cooldown=120,
+        ),
+    )
+
+    async def _read_permissions():
+        # the client reports the permissions of a new session before returning them
+        coordinator._permissions_changed(wrong_permissions)  # noqa: SLF001
+        return wrong_permissions
+
+    mock_client.read_permissions.side_effect = _read_permissions
+    load = (
+        coordinator._async_update_data  # noqa: SLF001
+        if refresh
+        else coordinator._async_setup  # noqa: SLF001
+    )
+
+    with pytest.raises(ConfigEntryAuthFailed) as exc_info:
+        await load()
+
+    assert exc_info.value.translation_key == "error_invalid_authentication_cooldown"
+    assert "retry_at" in exc_info.value.translation_placeholders
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_async_setup_raises_updatefailed_if_device_not_found(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Setup fails with UpdateFailed if the device can not be reached."""
+    mock_client.read_permissions.side_effect = BleakNotFoundError("boom")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_setup()  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_skips_notified_reads_when_connected(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Distance and rotation are kept by notifications while connected."""
+    mock_client.is_connected = True
+    coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+    mock_client.reset_mock()
+
+    data = await coordinator._async_update_data()  # noqa: SLF001
+
+    mock_client.read_distance.assert_not_awaited()
+    mock_client.read_rotation.assert_not_awaited()
+    mock_client.read_versions.assert_not_awaited()
+    assert data.connected is True
+    assert data.versions == coordinator.data.versions
+    assert data.distance == coordinator.data.distance
+    assert data.rotation == coordinator.data.rotation
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_reads_notified_values_after_reconnect(
+    hass: HomeAssistant,
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """A session reconnected by a service call gets distance and rotation read again."""
+    mock_client.is_connected = True
+    coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+    mock_client.reset_mock()
+
+    # the mount dropped the connection and the next action reconnects
+    coordinator._connection_changed(False)  # noqa: SLF001
+    mock_client.select_preset.side_effect = (
+        lambda _: coordinator._connection_changed(True)  # noqa: SLF001
+    )
+    await coordinator.select_preset(1)
+    mock_client.read_distance.return_value = 55
+
+    data = await coordinator._async_update_data()  # noqa: SLF001
+
+    mock_client.read_distance.assert_awaited_once()
+    mock_client.read_rotation.assert_awaited_once()
+    mock_client.read_versions.assert_awaited_once()
+    assert data.distance == 55
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_keeps_values_notified_during_refresh(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Values published while the refresh reads are running are not overwritten."""
+    mock_client.is_connected = True
+    coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+
+    async def _read_name():
+        coordinator.data = replace(coordinator.data, distance=42, rotation=-7)
+        return "Vogel"
+
+    mock_client.read_name.side_effect = _read_name
+
+    data = await coordinator._async_update_data()  # noqa: SLF001
+
+    assert data.distance == 42
+    assert data.rotation == -7
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_reports_first_connection(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """The session established by the first refresh is reported as connected."""
+    coordinator.data = None
+    mock_client.is_connected = True
+
+    data = await coordinator._async_update_data()  # noqa: SLF001
+
+    mock_client.read_distance.assert_awaited_once()
+    mock_client.read_rotation.assert_awaited_once()
+    mock_client.read_versions.assert_awaited_once()
+    assert data.connected is True
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_reads_distance_and_rotation_when_disconnected(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Distance and rotation are read after a (re)connect."""
+    mock_client.is_connected = False
+
+    data = await coordinator._async_update_data()  # noqa: SLF001
+
+    mock_client.read_distance.assert_awaited_once()
+    mock_client.read_rotation.assert_awaited_once()
+    mock_client.read_versions.assert_awaited_once()
+    assert data.distance == 10
+    assert data.rotation == 20
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_uses_latest_device_when_disconnected(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+    mock_dev: Mock,
+    mock_bledevice: BLEDevice,
+):
+    """The latest known device is handed to the client before reconnecting."""
+    mock_client.is_connected = False
+
+    await coordinator._async_update_data()  # noqa: SLF001
+
+    mock_client.update_device.assert_called_once_with(mock_bledevice)
+
+    mock_client.update_device.reset_mock()
+    mock_dev.return_value = None
+    await coordinator._async_update_data()  # noqa: SLF001
+    mock_client.update_device.assert_not_called()
+
+    mock_client.is_connected = True
+    mock_dev.return_value = mock_bledevice
+    await coordinator._async_update_data()  # noqa: SLF001
+    mock_client.update_device.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_backs_off_while_unreachable(
+    coordinator: VogelsMotionMountBleCoordinator,
+    mock_client: VogelsMotionMountBluetoothClient,
+):
+    """Update interval grows on failures up to a maximum and resets on success."""
+    mock_client.read_permissions.side_effect = BleakNotFoundError("boom")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()  # noqa: SLF001
+    assert coordinator.update_interval == UPDATE_INTERVAL * 2
+
+    for _ in range(10):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()  # noqa: SLF001
+    assert coordinator.update_interval == MAX_UPDATE_INTERVAL
+
+    mock_client.read_permissions.side_effect = None
+    await coordinator._async_update_data()  # noqa: SLF001
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_failed_action_does_not_back_off(
+    coordinator: VogelsMotionMountBleCoordinator,
+):
+    """Only failed refreshes slow down polling, failed entity actions do not."""
+    func = AsyncMock(side_effect=BleakConnectionError("boom"))
+
+    with pytest.raises(ServiceValidationError):
+        await coordinator._call(func)  # noqa: SLF001
+    coordinator._unavailable_callback(MagicMock())  # noqa: SLF001
+
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+
 @pytest.mark.asyncio
 async def test_async_update_data_propagates_entryauthfailed_on_exception(
     coordinator: VogelsMotionMountBleCoordinator,
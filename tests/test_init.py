@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from bleak.backends.device import BLEDevice
 import pytest
 
 from custom_components.vogels_motion_mount_ble import (
@@ -12,9 +13,6 @@ from custom_components.vogels_motion_mount_ble import (
     async_unload_entry,
 )
 from custom_components.vogels_motion_mount_ble.const import BLE_CALLBACK, DOMAIN
-from custom_components.vogels_motion_mount_ble.data import (
-    VogelsMotionMountAuthenticationType,
-)
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import (
@@ -60,6 +58,36 @@ async def test_async_setup_version_ok(
         assert result is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ha_version", ["2025.10.0.dev0", "2025.7.0b1", "2026.1.0"])
+async def test_async_setup_version_newer_release_ok(
+    mock_config_entry: MagicMock, hass: HomeAssistant, ha_version: str
+):
+    """Test that builds of newer releases pass the version check."""
+    with (
+        patch("custom_components.vogels_motion_mount_ble.ha_version", ha_version),
+        patch(
+            "custom_components.vogels_motion_mount_ble.async_setup_services", new=Mock()
+        ),
+    ):
+        assert await async_setup(hass, mock_config_entry) is True
+
+
+@pytest.mark.asyncio
+async def test_async_setup_version_prerelease_of_minimum_too_old(
+    mock_config_entry: MagicMock, hass: HomeAssistant
+):
+    """Test that a pre-release of the minimum version fails the version check."""
+    with (
+        patch(
+            "custom_components.vogels_motion_mount_ble.ha_version",
+            f"{MIN_HA_VERSION}b1",
+        ),
+        pytest.raises(IntegrationError),
+    ):
+        await async_setup(hass, mock_config_entry)
+
+
 @pytest.mark.asyncio
 @patch("custom_components.vogels_motion_mount_ble.async_setup_services")
 async def test_async_setup(
@@ -87,12 +115,6 @@ async def test_async_setup_entry_success(
     mock_config_entry: MagicMock, hass: HomeAssistant
 ):
     """Successful setup scenario."""
-    # Mock BLE device, coordinator, and permissions
-    mock_config_entry.runtime_data.data.permissions.auth_status.auth_type = (
-        VogelsMotionMountAuthenticationType.Control
-    )
-    mock_config_entry.runtime_data.data.permissions.auth_status.cooldown = 0
-
     with patch.object(
         hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
     ) as mock_forward:
@@ -157,6 +179,33 @@ async def test_async_setup_entry_device_not_found(
     )
 
 
+@pytest.mark.asyncio
+async def test_async_setup_entry_unregisters_ble_callback_once_device_found(
+    mock_config_entry: MagicMock,
+    mock_dev: AsyncMock,
+    mock_bledevice: BLEDevice,
+    hass: HomeAssistant,
+):
+    """The reload callback is dropped as soon as the device is found."""
+    unregister = Mock()
+    mock_dev.return_value = None
+    with (
+        patch.object(bluetooth, "async_register_callback", return_value=unregister),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await async_setup_entry(hass, mock_config_entry)
+    unregister.assert_not_called()
+
+    mock_dev.return_value = mock_bledevice
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+
+    unregister.assert_called_once()
+    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_refresh_failure(
     mock_config_entry: MagicMock, hass: HomeAssistant
@@ -165,10 +214,6 @@ async def test_async_setup_entry_refresh_failure(
     mock_config_entry.runtime_data.async_config_entry_first_refresh.side_effect = (
         Exception("refresh failed")
     )
-    mock_config_entry.runtime_data.data.permissions.auth_status.auth_type = (
-        VogelsMotionMountAuthenticationType.Control
-    )
-    mock_config_entry.runtime_data.data.permissions.auth_status.cooldown = 0
 
     with pytest.raises(ConfigEntryNotReady, match="refresh failed"):
         await async_setup_entry(hass, mock_config_entry)
@@ -200,39 +245,6 @@ async def test_async_setup_entry_propagates_homeassistanterror_as_entry_not_read
         await async_setup_entry(hass, mock_config_entry)
 
 
-@pytest.mark.asyncio
-async def test_async_setup_entry_wrong_permissions_no_cooldown(
-    mock_config_entry: MagicMock, hass: HomeAssistant
-):
-    """Permissions wrong without cooldown."""
-    mock_config_entry.runtime_data.async_config_entry_first_refresh.return_value = None
-    mock_config_entry.runtime_data.data.permissions.auth_status.auth_type = (
-        VogelsMotionMountAuthenticationType.Wrong
-    )
-    mock_config_entry.runtime_data.data.permissions.auth_status.cooldown = 0
-
-    with pytest.raises(ConfigEntryAuthFailed):
-        await async_setup_entry(hass, mock_config_entry)
-
-
-@pytest.mark.asyncio
-async def test_async_setup_entry_wrong_permissions_with_cooldown(
-    mock_config_entry: MagicMock, hass: HomeAssistant
-):
-    """Permissions wrong with cooldown."""
-    mock_config_entry.runtime_data.async_config_entry_first_refresh.return_value = None
-    mock_config_entry.runtime_data.data.permissions.auth_status.auth_type = (
-        VogelsMotionMountAuthenticationType.Wrong
-    )
-    mock_config_entry.runtime_data.data.permissions.auth_status.cooldown = 120
-
-    with pytest.raises(ConfigEntryAuthFailed) as exc_info:  # noqa: PT012
-        await async_setup_entry(hass, mock_config_entry)
-
-        # Ensure the exception contains retry_at
-        assert "retry_at" in str(exc_info.value)
-
-
 @pytest.mark.asyncio
 async def test_setup_entry_propagates_homeassistant_error(
     mock_config_entry: MagicMock, hass: HomeAssistant
@@ -1,5 +1,6 @@
 """Tests for number entities."""
 
+from dataclasses import replace
 from unittest.mock import patch
 
 import pytest
@@ -86,7 +87,7 @@ async def test_set_preset_distance_number(mock_coord: VogelsMotionMountBleCoordi
         index=0,
         data=VogelsMotionMountPresetData(name="0", distance=10, rotation=20),
     )
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
 
     number = PresetDistanceNumber(mock_coord, preset_index=0)
     await number.async_set_native_value(55.6)
@@ -104,7 +105,7 @@ async def test_set_preset_rotation_number(mock_coord: VogelsMotionMountBleCoordi
         index=1,
         data=VogelsMotionMountPresetData(name="1", distance=15, rotation=-10),
     )
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
 
     number = PresetRotationNumber(mock_coord, preset_index=0)
     await number.async_set_native_value(77.9)
@@ -132,8 +133,8 @@ def test_distance_number_native_value_requested(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Request distance."""
-    mock_coord.data.requested_distance = 42
-    mock_coord.data.distance = 99  # should be ignored if requested_distance exists
+    # distance should be ignored if requested_distance exists
+    mock_coord.data = replace(mock_coord.data, requested_distance=42, distance=99)
     number = DistanceNumber(mock_coord)
     assert number.native_value == 42
 
@@ -142,8 +143,7 @@ def test_distance_number_native_value_fallback(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Fallback to current distance if no distance was requested."""
-    mock_coord.data.requested_distance = None
-    mock_coord.data.distance = 77
+    mock_coord.data = replace(mock_coord.data, requested_distance=None, distance=77)
     number = DistanceNumber(mock_coord)
     assert number.native_value == 77
 
@@ -161,8 +161,8 @@ def test_rotation_number_native_value_requested(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Request rotation."""
-    mock_coord.data.requested_rotation = -33
-    mock_coord.data.rotation = 88  # should be ignored if requested_rotation exists
+    # rotation should be ignored if requested_rotation exists
+    mock_coord.data = replace(mock_coord.data, requested_rotation=-33, rotation=88)
     number = RotationNumber(mock_coord)
     assert number.native_value == -33
 
@@ -171,8 +171,7 @@ def test_rotation_number_native_value_fallback(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Fallback to current rotation if no rotation was requested."""
-    mock_coord.data.requested_rotation = None
-    mock_coord.data.rotation = 55
+    mock_coord.data = replace(mock_coord.data, requested_rotation=None, rotation=55)
     number = RotationNumber(mock_coord)
     assert number.native_value == 55
 
@@ -183,7 +182,7 @@ def test_preset_distance_number_native_value_none(
     """Test preset distance no data."""
     # Preset with no data
     preset = VogelsMotionMountPreset(index=0, data=None)
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
     number = PresetDistanceNumber(mock_coord, preset_index=0)
     assert number.native_value is None
 
@@ -196,7 +195,7 @@ def test_preset_distance_number_native_value_with_data(
     preset = VogelsMotionMountPreset(
         index=0, data=VogelsMotionMountPresetData(name="test", distance=42, rotation=0)
     )
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
     number = PresetDistanceNumber(mock_coord, preset_index=0)
     assert number.native_value == 42
 
@@ -207,7 +206,7 @@ def test_preset_rotation_number_native_value_none(
     """Test preset rotation no data."""
     # Preset with no data
     preset = VogelsMotionMountPreset(index=0, data=None)
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
     number = PresetRotationNumber(mock_coord, preset_index=0)
     assert number.native_value is None
 
@@ -220,6 +219,6 @@ def test_preset_rotation_number_native_value_with_data(
     preset = VogelsMotionMountPreset(
         index=0, data=VogelsMotionMountPresetData(name="test", distance=0, rotation=-15)
     )
-    mock_coord.data.presets = [preset]
+    mock_coord.data = replace(mock_coord.data, presets=[preset])
     number = PresetRotationNumber(mock_coord, preset_index=0)
     assert number.native_value == -15
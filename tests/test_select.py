@@ -1,5 +1,6 @@
 """Tests for select entities."""
 
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -57,7 +58,9 @@ async def test_automove_select_option_zero(mock_coord: VogelsMotionMountBleCoord
     """Test automove select option."""
     mock_coord.set_automove = AsyncMock()
     # Current automove → Hdmi_2_On (value=4)
-    mock_coord.data.automove = VogelsMotionMountAutoMoveType.Hdmi_2_On
+    mock_coord.data = replace(
+        mock_coord.data, automove=VogelsMotionMountAutoMoveType.Hdmi_2_On
+    )
     select = AutomoveSelect(mock_coord)
 
     await select.async_select_option("0")
@@ -74,7 +77,9 @@ async def test_automove_select_option_enabled(
 ):
     """Test automove select option."""
     mock_coord.set_automove = AsyncMock()
-    mock_coord.data.automove = VogelsMotionMountAutoMoveType.Hdmi_1_Off
+    mock_coord.data = replace(
+        mock_coord.data, automove=VogelsMotionMountAutoMoveType.Hdmi_1_Off
+    )
     select = AutomoveSelect(mock_coord)
 
     await select.async_select_option("3")
@@ -98,7 +103,7 @@ async def test_freeze_preset_select_option(mock_coord: VogelsMotionMountBleCoord
             1, VogelsMotionMountPresetData(name="two", distance=20, rotation=10)
         ),
     ]
-    mock_coord.data.presets = presets
+    mock_coord.data = replace(mock_coord.data, presets=presets)
     select = FreezePresetSelect(mock_coord)
 
     # Options will be ["0", "one", "two"]
@@ -118,7 +123,9 @@ def test_automove_select_current_option_off(
 ):
     """Test automove off option."""
     # Off case: Hdmi_3_Off = 9 → odd → maps to "0"
-    mock_coord.data.automove = VogelsMotionMountAutoMoveType.Hdmi_3_Off
+    mock_coord.data = replace(
+        mock_coord.data, automove=VogelsMotionMountAutoMoveType.Hdmi_3_Off
+    )
     select = AutomoveSelect(mock_coord)
     assert select.current_option == "0"
 
@@ -126,7 +133,9 @@ def test_automove_select_current_option_off(
 def test_automove_select_current_option_on(mock_coord: VogelsMotionMountBleCoordinator):
     """Test automove on option."""
     # On case: Hdmi_4_On = 12 → even → maps to (12 // 4) + 1 = 4
-    mock_coord.data.automove = VogelsMotionMountAutoMoveType.Hdmi_4_On
+    mock_coord.data = replace(
+        mock_coord.data, automove=VogelsMotionMountAutoMoveType.Hdmi_4_On
+    )
     select = AutomoveSelect(mock_coord)
     assert select.current_option == "4"
 
@@ -135,8 +144,7 @@ def test_freeze_preset_select_current_option_none_index(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Test freeze preset no option."""
-    mock_coord.data.freeze_preset_index = None
-    mock_coord.data.presets = []
+    mock_coord.data = replace(mock_coord.data, freeze_preset_index=None, presets=[])
     select = FreezePresetSelect(mock_coord)
     assert select.current_option is None
 
@@ -145,8 +153,8 @@ def test_freeze_preset_select_current_option_invalid_index(
     mock_coord: VogelsMotionMountBleCoordinator,
 ):
     """Test freeze preset invalid index."""
-    mock_coord.data.freeze_preset_index = 99  # out of range
-    mock_coord.data.presets = []
+    # out of range
+    mock_coord.data = replace(mock_coord.data, freeze_preset_index=99, presets=[])
     select = FreezePresetSelect(mock_coord)
     assert select.current_option is None
 
@@ -163,8 +171,8 @@ def test_freeze_preset_select_current_option_valid(
             1, VogelsMotionMountPresetData(name="two", distance=20, rotation=10)
         ),
     ]
-    mock_coord.data.presets = presets
-    mock_coord.data.freeze_preset_index = 2  # corresponds to "two"
+    # index 2 corresponds to "two"
+    mock_coord.data = replace(mock_coord.data, presets=presets, freeze_preset_index=2)
     select = FreezePresetSelect(mock_coord)
 
     # Options should be ["0", "one", "two"]
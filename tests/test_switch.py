@@ -70,7 +70,7 @@ async def test_multi_pin_features_switch_toggle_actions(
     """Test all switch actions for multi pin features."""
     # Ensure initial field is False
     features = replace(mock_coord.data.multi_pin_features, **{field: False})
-    mock_coord.data.multi_pin_features = features
+    mock_coord.data = replace(mock_coord.data, multi_pin_features=features)
     mock_coord.set_multi_pin_features = AsyncMock()
 
     entity = switch_cls(mock_coord)
@@ -84,7 +84,9 @@ async def test_multi_pin_features_switch_toggle_actions(
     mock_coord.set_multi_pin_features.reset_mock()
 
     # Update coordinator state → set field True
-    mock_coord.data.multi_pin_features = replace(features, **{field: True})
+    mock_coord.data = replace(
+        mock_coord.data, multi_pin_features=replace(features, **{field: True})
+    )
     assert entity.is_on is True
 
     # Turn off → should toggle field False
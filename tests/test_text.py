@@ -1,5 +1,6 @@
 """Tests for text entities."""
 
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -47,7 +48,7 @@ async def test_all_entities(
 async def test_name_text_set_value(mock_coord: VogelsMotionMountBleCoordinator):
     """Test setting name."""
     mock_coord.set_name = AsyncMock()
-    mock_coord.data.name = "Old Name"
+    mock_coord.data = replace(mock_coord.data, name="Old Name")
 
     entity = NameText(mock_coord)
 